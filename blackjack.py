@@ -8,6 +8,8 @@ import time
 SUITS = ['♠', '♥', '♦', '♣']
 RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
 VALUES = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10, 'J': 10, 'Q': 10, 'K': 10, 'A': 11}
+RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+TEN_INDICES = [RANK_INDEX[r] for r in RANKS if VALUES[r] == 10]
 DEALER_HITS_ON_SOFT_17 = True
 MAX_PLAYERS = 6 # Dealer + 5 others
 
@@ -40,11 +42,13 @@ class Deck:
     def __init__(self, num_decks=4):
         self.num_decks = num_decks
         self.cards = []
+        self.rank_counts = []
         self.build()
 
     def build(self):
         """Builds the deck with the specified number of 52-card decks."""
         self.cards = [Card(s, r) for _ in range(self.num_decks) for s in SUITS for r in RANKS]
+        self.rank_counts = [len(SUITS) * self.num_decks] * len(RANKS) # Remaining cards per rank
         self.shuffle()
 
     def shuffle(self):
@@ -57,7 +61,23 @@ class Deck:
         """Deals one card from the deck."""
         if not self.cards:
             self.build() # Reshuffle if empty
-        return self.cards.pop()
+        card = self.cards.pop()
+        self.rank_counts[RANK_INDEX[card.rank]] -= 1
+        return card
+
+    def tens_remaining(self):
+        """Counts the ten-value cards left in the deck."""
+        return sum(self.rank_counts[i] for i in TEN_INDICES)
+
+    def ten_density(self):
+        """Fraction of the remaining cards that are worth ten."""
+        return self.tens_remaining() / len(self.cards) if self.cards else 0
+
+    def ace_richness(self):
+        """Remaining aces relative to a fresh deck's share (1.0 is neutral, above is ace-rich)."""
+        if not self.cards:
+            return 0
+        return self.rank_counts[RANK_INDEX['A']] * len(RANKS) / len(self.cards)
 
 class Player:
     """Represents a player (or the dealer)."""
@@ -183,6 +203,17 @@ class BlackjackGame:
         decks_remaining = len(self.deck.cards) / 52
         return self.running_count / decks_remaining if decks_remaining > 0 else 0
 
+    def insurance_ev(self):
+        """Exact expected value of an insurance bet per unit staked.
+
+        The unseen cards are the deck plus the dealer's hole card, so the
+        hole card is a ten with probability (tens left + hole is ten) / (cards left + 1).
+        """
+        hole_card = self.dealer.hands[0].cards[1]
+        tens = self.deck.tens_remaining() + (VALUES[hole_card.rank] == 10)
+        p_ten = tens / (len(self.deck.cards) + 1)
+        return 2 * p_ten - (1 - p_ten) # Pays 2:1
+
     def place_bets(self):
         """Handles the betting phase for all players."""
         for player in self.players:
@@ -203,6 +234,7 @@ class BlackjackGame:
                 player.hands.append(Hand(bet_amount))
                 player.wallet -= bet_amount
                 print(f"{player.name} bets ${bet_amount}.")
+        self.dealer.hands.append(Hand(0)) # Dealer plays every round without a bet
 
     def deal_initial_cards(self):
         """Deals two cards to each player and the dealer."""
@@ -251,7 +283,7 @@ class BlackjackGame:
         
         print("-" * 25)
         if self.toggles['show_count']:
-            print(f"Running Count: {self.running_count} | True Count: {self.get_true_count():.2f}")
+            print(f"Running Count: {self.running_count} | True Count: {self.get_true_count():.2f} | Ten Density: {self.deck.ten_density():.1%}")
 
 
     def play_round(self):
@@ -315,7 +347,7 @@ class BlackjackGame:
         """Offers the insurance side bet to players."""
         print("\nDealer is showing an Ace. Insurance is open.")
         for player in self.players:
-            if not player.hands or player.hands[0].is_blackjack(): continue
+            if player.name == "Dealer" or not player.hands or player.hands[0].is_blackjack(): continue
 
             hand = player.hands[0]
             if player.is_human and player.wallet >= hand.bet / 2:
@@ -326,8 +358,8 @@ class BlackjackGame:
                     player.wallet -= insurance_bet
                     print(f"You placed an insurance bet of ${insurance_bet}.")
             elif not player.is_human and player.wallet >= hand.bet / 2:
-                # CPU takes insurance if true count is high
-                if self.get_true_count() >= 3:
+                # CPU takes insurance when it has positive expected value
+                if self.insurance_ev() > 0:
                     insurance_bet = hand.bet / 2
                     hand.insurance = insurance_bet
                     player.wallet -= insurance_bet
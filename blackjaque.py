@@ -13,8 +13,7 @@ BOLD = "\033[1m"
 # ===== Game Settings =====
 NUM_DECKS = 6
 SHUFFLE_POINT = 0.25
-bankroll = 1000
-base_unit = bankroll * 0.01
+BANKROLL = 1000
 
 # ===== Card Values =====
 values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
@@ -22,11 +21,6 @@ values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
 hi_lo = {'2': 1, '3': 1, '4': 1, '5': 1, '6': 1, '7': 0, '8': 0, '9': 0,
          '10': -1, 'J': -1, 'Q': -1, 'K': -1, 'A': -1}
 
-# ===== Toggles =====
-show_table = False
-show_recommend = False
-show_counts = False
-
 # ===== Basic Strategy Table (Multi-Deck, S17) =====
 strategy_table = {
     'hard': {
@@ -63,28 +57,7 @@ strategy_table = {
     }
 }
 
-# ===== Shoe & Count =====
-shoe = []
-running_count = 0
-
-def build_shoe():
-    deck = list(values.keys()) * 4
-    shoe.clear()
-    for _ in range(NUM_DECKS):
-        shoe.extend(deck)
-    random.shuffle(shoe)
-
-build_shoe()
-
-def draw_card():
-    global running_count
-    if len(shoe) < NUM_DECKS*52*SHUFFLE_POINT:
-        build_shoe()
-        print(f"{YELLOW}*** Shoe reshuffled! ***{RESET}")
-    card = shoe.pop()
-    running_count += hi_lo[card]
-    return card
-
+# ===== Hands & Strategy =====
 def hand_value(hand):
     val = sum(values[c] for c in hand)
     aces = hand.count('A')
@@ -117,9 +90,9 @@ def display_table():
             row += f" {color}{move}{RESET} "
         print(row)
 
-def get_recommendation(hand, dealer_up):
+def get_recommendation(hand, dealer_up, allow_split=True):
     dealer_idx = "A" if dealer_up=='A' else dealer_up
-    if len(hand)==2 and hand[0]==hand[1] and hand[0] in strategy_table['pair']:
+    if allow_split and len(hand)==2 and hand[0]==hand[1] and hand[0] in strategy_table['pair']:
         return strategy_table['pair'][hand[0]][index_for_card(dealer_up)]
     if 'A' in hand and hand_value(hand)<=21 and hand_value(hand)>=13:
         key = 'A'+str(hand_value(hand)-11)
@@ -133,59 +106,145 @@ def get_recommendation(hand, dealer_up):
 def index_for_card(card):
     return {'2':0,'3':1,'4':2,'5':3,'6':4,'7':5,'8':6,'9':7,'10':8,'J':8,'Q':8,'K':8,'A':9}[card]
 
-def true_count():
-    decks_remaining = max(1, len(shoe)/52)
-    return round(running_count/decks_remaining, 2)
+# ===== Engine =====
+class BlackjaqueEngine:
+    """One shoe, running count and bankroll. Engines share nothing, so many can run side by side.
+
+    The shoe is built lazily on the first draw. Each engine shuffles with its
+    own random.Random, so passing a seed makes its shoes reproducible.
+    """
+    def __init__(self, bankroll=BANKROLL, num_decks=NUM_DECKS, shuffle_point=SHUFFLE_POINT,
+                 seed=None, announce_shuffle=False):
+        self.bankroll = bankroll
+        self.base_unit = bankroll * 0.01
+        self.num_decks = num_decks
+        self.shuffle_point = shuffle_point
+        self.rng = random.Random(seed)
+        self.announce_shuffle = announce_shuffle
+        self.shoe = []
+        self.running_count = 0
+
+    def build_shoe(self):
+        deck = list(values.keys()) * 4
+        self.shoe.clear()
+        for _ in range(self.num_decks):
+            self.shoe.extend(deck)
+        self.rng.shuffle(self.shoe)
+
+    def draw_card(self):
+        if not self.shoe:
+            self.build_shoe()
+        elif len(self.shoe) < self.num_decks*52*self.shuffle_point:
+            self.build_shoe()
+            if self.announce_shuffle:
+                print(f"{YELLOW}*** Shoe reshuffled! ***{RESET}")
+        card = self.shoe.pop()
+        self.running_count += hi_lo[card]
+        return card
+
+    def true_count(self):
+        decks_remaining = max(1, len(self.shoe)/52)
+        return round(self.running_count/decks_remaining, 2)
+
+    def recommended_bet(self):
+        tc = self.true_count()
+        return self.base_unit * max(1, int(tc)) if tc > 0 else self.base_unit
+
+    def deal(self):
+        """Deals a new round, returning (player, dealer)."""
+        player = [self.draw_card(), self.draw_card()]
+        dealer = [self.draw_card(), self.draw_card()]
+        return player, dealer
+
+    def dealer_play(self, dealer):
+        while hand_value(dealer) < 17:
+            dealer.append(self.draw_card())
+
+    def settle(self, player, dealer, bet):
+        """Pays out a finished round and returns the bankroll change."""
+        pv, dv = hand_value(player), hand_value(dealer)
+        if pv > 21: net = -bet
+        elif dv > 21 or pv > dv: net = bet
+        elif pv < dv: net = -bet
+        else: net = 0
+        self.bankroll += net
+        return net
+
+    def play_round(self, bet, choose=get_recommendation):
+        """Plays a round without prompting; choose(hand, dealer_up) returns a strategy_table move.
+
+        There is no splitting, so 'P' falls back to the hard or soft total's move,
+        and 'D' after the first two cards is a hit.
+        """
+        player, dealer = self.deal()
+        while hand_value(player) < 21:
+            action = choose(player, dealer[0])
+            if action == 'P':
+                action = get_recommendation(player, dealer[0], allow_split=False)
+            if action == 'D' and len(player) == 2:
+                bet *= 2
+                player.append(self.draw_card())
+                break
+            elif action in ('H', 'D'):
+                player.append(self.draw_card())
+            else:
+                break
+        if hand_value(player) <= 21:
+            self.dealer_play(dealer)
+        return self.settle(player, dealer, bet)
 
 # ===== Main Loop =====
-while True:
-    os.system('clear' if os.name=='posix' else 'cls')
-    if show_counts:
-        print(f"{CYAN}Running Count:{RESET} {running_count}  |  {CYAN}True Count:{RESET} {true_count()}")
-    if show_table:
-        display_table()
-
-    player = [draw_card(), draw_card()]
-    dealer = [draw_card(), draw_card()]
-
-    recommended_bet = base_unit * max(1, int(true_count())) if true_count() > 0 else base_unit
-    print(f"\nBankroll: {bankroll} | Recommended Bet: {recommended_bet:.2f}")
-    bet = float(input("Enter bet: "))
-
-    print(f"Dealer shows: {dealer[0]}  | Your hand: {player} ({hand_value(player)})")
-    if show_recommend:
-        rec = get_recommendation(player, dealer[0])
-        print(f"{YELLOW}Recommended Move:{RESET} {rec}")
-
-    while hand_value(player) < 21:
-        action = input("[H]it, [S]tand, [D]ouble, [T]oggle table, [R]ec toggle, [C]ount toggle: ").upper()
-        if action == 'H':
-            player.append(draw_card())
-            print(f"You drew {player[-1]} -> {player} ({hand_value(player)})")
-        elif action == 'S':
-            break
-        elif action == 'D':
-            bet *= 2
-            player.append(draw_card())
-            break
-        elif action == 'T': show_table = not show_table
-        elif action == 'R': show_recommend = not show_recommend
-        elif action == 'C': show_counts = not show_counts
-
-    if hand_value(player) > 21:
-        print(f"{RED}BUST!{RESET} You lose.")
-        bankroll -= bet
-        input("Press Enter...")
-        continue
-
-    while hand_value(dealer) < 17:
-        dealer.append(draw_card())
-
-    print(f"Dealer's hand: {dealer} ({hand_value(dealer)})")
-    pv, dv = hand_value(player), hand_value(dealer)
-    if dv > 21 or pv > dv: bankroll += bet
-    elif pv < dv: bankroll -= bet
-    else: pass
-
-    print(f"New bankroll: {bankroll}")
-    input("Press Enter to continue...")
+def main():
+    engine = BlackjaqueEngine(seed=random.getrandbits(64), announce_shuffle=True) # random.seed() still replays a session
+    show_table = False
+    show_recommend = False
+    show_counts = False
+
+    while True:
+        os.system('clear' if os.name=='posix' else 'cls')
+        if show_counts:
+            print(f"{CYAN}Running Count:{RESET} {engine.running_count}  |  {CYAN}True Count:{RESET} {engine.true_count()}")
+        if show_table:
+            display_table()
+
+        player, dealer = engine.deal()
+
+        print(f"\nBankroll: {engine.bankroll} | Recommended Bet: {engine.recommended_bet():.2f}")
+        bet = float(input("Enter bet: "))
+
+        print(f"Dealer shows: {dealer[0]}  | Your hand: {player} ({hand_value(player)})")
+        if show_recommend:
+            rec = get_recommendation(player, dealer[0])
+            print(f"{YELLOW}Recommended Move:{RESET} {rec}")
+
+        while hand_value(player) < 21:
+            action = input("[H]it, [S]tand, [D]ouble, [T]oggle table, [R]ec toggle, [C]ount toggle: ").upper()
+            if action == 'H':
+                player.append(engine.draw_card())
+                print(f"You drew {player[-1]} -> {player} ({hand_value(player)})")
+            elif action == 'S':
+                break
+            elif action == 'D':
+                bet *= 2
+                player.append(engine.draw_card())
+                break
+            elif action == 'T': show_table = not show_table
+            elif action == 'R': show_recommend = not show_recommend
+            elif action == 'C': show_counts = not show_counts
+
+        if hand_value(player) > 21:
+            print(f"{RED}BUST!{RESET} You lose.")
+            engine.settle(player, dealer, bet)
+            input("Press Enter...")
+            continue
+
+        engine.dealer_play(dealer)
+
+        print(f"Dealer's hand: {dealer} ({hand_value(dealer)})")
+        engine.settle(player, dealer, bet)
+
+        print(f"New bankroll: {engine.bankroll}")
+        input("Press Enter to continue...")
+
+if __name__ == "__main__":
+    main()
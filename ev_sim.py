@@ -0,0 +1,272 @@
+# ev_sim.py
+
+import argparse
+import math
+import random
+import time
+
+from blackjack import DEALER_HITS_ON_SOFT_17, Card, Hand, BlackjackGame
+from blackjaque import values, hand_value, get_recommendation
+
+# --- Configuration ---
+NUM_DECKS = 6
+PENETRATION = 0.75  # Fraction of each shoe dealt before the cut card
+RESERVE = 26        # Cards always kept behind the cut card so no round empties the shoe
+MAX_HANDS = 4       # Hands a player may split up to
+Z_95 = 1.96
+
+# Antithetic shoes swap low and high cards rank for rank, which keeps the
+# composition and flips the sign of every Hi-Lo count along the shoe.
+MIRROR = {'2': 'A', '3': 'K', '4': 'Q', '5': 'J', '6': '10', '7': '7', '8': '8', '9': '9',
+          '10': '6', 'J': '5', 'Q': '4', 'K': '3', 'A': '2'}
+
+# --- Strategies ---
+# A strategy takes (hand ranks, dealer up rank, allow_split) and returns 'H', 'S', 'D' or 'P'.
+GAME = BlackjackGame()  # Only used for its strategy chart
+CHART_MOVES = {"Hit": 'H', "Stand": 'S', "Double Down": 'D', "Split": 'P'}
+
+
+class _NoSplitHand(Hand):
+    def can_split(self):
+        return False
+
+
+def chart_strategy(ranks, up, allow_split=True):
+    """blackjack.py's get_recommended_move."""
+    hand = Hand(0) if allow_split else _NoSplitHand(0)
+    for r in ranks:
+        hand.add_card(Card('♠', r))
+    return CHART_MOVES[GAME.get_recommended_move(hand, Card('♠', up))]
+
+
+def table_strategy(ranks, up, allow_split=True):
+    """blackjaque.py's strategy_table."""
+    return get_recommendation(ranks, up, allow_split=allow_split)
+
+
+STRATEGIES = {'chart': chart_strategy, 'table': table_strategy}
+
+# --- Shoes & Rounds ---
+def make_shoe(seed, num_decks=NUM_DECKS, antithetic=False):
+    """Builds the shoe for a seed; the same seed always gives the same card order."""
+    shoe = list(values.keys()) * 4 * num_decks
+    random.Random(seed).shuffle(shoe)
+    if antithetic:
+        shoe = [MIRROR[c] for c in shoe]
+    return shoe
+
+
+def play_hand(shoe, ranks, up, strategy, hands, can_split=True):
+    """Plays one player hand to completion, splitting into hands; returns (ranks, bet)."""
+    bet = 1
+    while hand_value(ranks) < 21:
+        allow_split = can_split and len(ranks) == 2 and ranks[0] == ranks[1] and hands < MAX_HANDS
+        move = strategy(ranks, up, allow_split)
+        if move == 'P' and allow_split:
+            return None, 0 # The caller splits
+        if move == 'D' and len(ranks) == 2:
+            bet = 2
+            ranks.append(shoe.pop())
+            break
+        if move in ('H', 'D', 'P'):
+            ranks.append(shoe.pop())
+        else:
+            break
+    return ranks, bet
+
+
+def play_round(shoe, strategy, hits_soft_17):
+    """Plays one round against the dealer and returns the player's net in units."""
+    player = [shoe.pop(), shoe.pop()]
+    dealer = [shoe.pop(), shoe.pop()]
+    up = dealer[0]
+    player_bj = hand_value(player) == 21
+    if hand_value(dealer) == 21:
+        return 0 if player_bj else -1
+    if player_bj:
+        return 1.5
+
+    # Split hands are played one after another, each dealt its second card first
+    pending, finished = [player], []
+    while pending:
+        ranks = pending.pop(0)
+        if len(ranks) == 1:
+            ranks.append(shoe.pop())
+            if ranks[0] == 'A':
+                finished.append((ranks, 1)) # Split aces get one card each
+                continue
+        played, bet = play_hand(shoe, ranks, up, strategy, len(pending) + len(finished) + 1)
+        if played is None:
+            pending[:0] = [[ranks[0]], [ranks[1]]]
+        else:
+            finished.append((played, bet))
+
+    if any(hand_value(r) <= 21 for r, _ in finished):
+        while True:
+            dv = hand_value(dealer)
+            soft = 'A' in dealer and sum(values[c] for c in dealer) - 10 * dealer.count('A') + 10 == dv
+            if dv < 17 or (dv == 17 and soft and hits_soft_17):
+                dealer.append(shoe.pop())
+            else:
+                break
+
+    dv = hand_value(dealer)
+    net = 0
+    for ranks, bet in finished:
+        pv = hand_value(ranks)
+        if pv > 21: net -= bet
+        elif dv > 21 or pv > dv: net += bet
+        elif pv < dv: net -= bet
+    return net
+
+
+def play_shoe(shoe, strategy, hits_soft_17=DEALER_HITS_ON_SOFT_17, penetration=PENETRATION):
+    """Plays rounds until the cut card; returns (net units, rounds)."""
+    shoe = list(shoe)
+    cut = max(len(shoe) * (1 - penetration), RESERVE)
+    net, rounds = 0, 0
+    while len(shoe) > cut:
+        net += play_round(shoe, strategy, hits_soft_17)
+        rounds += 1
+    return net, rounds
+
+# --- Estimates ---
+class PairedTotals:
+    """Per-shoe (net, rounds) totals of configs A and B played on the same shoes.
+
+    Each config's EV per round is its total net over its total rounds, so every
+    round counts once; averaging per-shoe ratios would over-weight short shoes.
+    Confidence intervals use the delta method: a ratio's error is the mean of
+    the per-shoe residuals net - EV * rounds over the mean rounds per shoe.
+    """
+    def __init__(self):
+        self.n = 0
+        self._sum = [0.0] * 4  # net A, rounds A, net B, rounds B
+        self._cross = [[0.0] * 4 for _ in range(4)]
+
+    def add(self, net_a, rounds_a, net_b, rounds_b):
+        x = (net_a, rounds_a, net_b, rounds_b)
+        self.n += 1
+        for i in range(4):
+            self._sum[i] += x[i]
+            for j in range(4):
+                self._cross[i][j] += x[i] * x[j]
+
+    def ev(self, config):
+        """EV per round of config 0 (A) or 1 (B)."""
+        i = 2 * config
+        return self._sum[i] / self._sum[i + 1] if self._sum[i + 1] else 0.0
+
+    def _residual(self, config, sign=1):
+        """Weights on (net A, rounds A, net B, rounds B) of a config's scaled residual."""
+        i = 2 * config
+        mean_rounds = self._sum[i + 1] / self.n
+        weights = [0.0] * 4
+        weights[i] = sign / mean_rounds
+        weights[i + 1] = -sign * self.ev(config) / mean_rounds
+        return weights
+
+    def _variance(self, weights):
+        """Sample variance of the weighted sum of a shoe's totals."""
+        if self.n < 2:
+            return math.inf
+        terms = [wi * wj * (self._cross[i][j] - self._sum[i] * self._sum[j] / self.n)
+                 for i, wi in enumerate(weights) for j, wj in enumerate(weights)]
+        # Terms that cancel to rounding error mean the weighted sum never varied
+        total = sum(terms)
+        if total <= 1e-9 * sum(abs(t) for t in terms):
+            return 0.0
+        return total / (self.n - 1)
+
+    def variance(self, config=None):
+        """Per-shoe variance of a config's residual, or of A's minus B's with config=None."""
+        if config is not None:
+            return self._variance(self._residual(config))
+        a, b = self._residual(0), self._residual(1, sign=-1)
+        return self._variance([wa + wb for wa, wb in zip(a, b)])
+
+    def half_width(self, config=None, z=Z_95):
+        """Half-width of the confidence interval for a config's EV, or for A-B with config=None."""
+        return z * math.sqrt(max(self.variance(config), 0) / self.n) if self.n > 1 else math.inf
+
+    def describe(self, config=None):
+        ev = self.ev(0) - self.ev(1) if config is None else self.ev(config)
+        return f"{ev:+.4f} ± {self.half_width(config):.4f}"
+
+
+def compare(a, b, half_width, antithetic=False, num_decks=NUM_DECKS, min_shoes=30,
+            max_shoes=1_000_000, seed=0, report_every=0):
+    """Estimates EV per round for configs a and b and their difference.
+
+    Each config is (strategy, hits_soft_17). Both play the same shoes (common
+    random numbers), so one sample per shoe is both configs' net and rounds.
+    With antithetic, each sample totals a shoe and its mirror. Stops once the
+    difference's CI half-width reaches half_width; a difference that hasn't
+    varied yet has no interval to trust, so the run continues.
+    """
+    if a == b:
+        raise ValueError("A and B are the same config")
+    if num_decks * 52 <= RESERVE:
+        raise ValueError(f"a shoe needs more than the {RESERVE} cards kept behind the cut card")
+    totals = PairedTotals()
+    rounds = 0
+    start = time.perf_counter()
+    for i in range(max_shoes):
+        shoes = [make_shoe(seed + i, num_decks)]
+        if antithetic:
+            shoes.append(make_shoe(seed + i, num_decks, antithetic=True))
+        sample = [0, 0, 0, 0]
+        for shoe in shoes:
+            for k, config in enumerate((a, b)):
+                net, shoe_rounds = play_shoe(shoe, *config)
+                sample[2 * k] += net
+                sample[2 * k + 1] += shoe_rounds
+                rounds += shoe_rounds
+        totals.add(*sample)
+
+        done = totals.n >= min_shoes and 0 < totals.half_width() <= half_width
+        if report_every and (totals.n % report_every == 0 or done):
+            print(f"{totals.n:>8} shoes | A {totals.describe(0)} | B {totals.describe(1)} | "
+                  f"A-B {totals.describe()} | {rounds / (time.perf_counter() - start):,.0f} rounds/s")
+        if done:
+            break
+    return totals
+
+
+def parse_config(text):
+    """Parses 'strategy[:H17|S17]' into (strategy function, hits_soft_17)."""
+    name, _, rules = text.partition(':')
+    hits_soft_17 = DEALER_HITS_ON_SOFT_17 if not rules else rules.upper() == 'H17'
+    return STRATEGIES[name], hits_soft_17
+
+
+# --- Main ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare strategies or rules with common random numbers.")
+    parser.add_argument("a", help="strategy[:rules], e.g. chart or table:S17")
+    parser.add_argument("b", help="strategy[:rules] to compare against")
+    parser.add_argument("--half-width", type=float, default=0.005, help="target 95%% CI half-width of A-B")
+    parser.add_argument("--antithetic", action="store_true", help="pair every shoe with its mirror shoe")
+    parser.add_argument("--decks", type=int, default=NUM_DECKS)
+    parser.add_argument("--max-shoes", type=int, default=1_000_000)
+    parser.add_argument("--report-every", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        totals = compare(parse_config(args.a), parse_config(args.b), args.half_width,
+                         antithetic=args.antithetic, num_decks=args.decks,
+                         max_shoes=args.max_shoes, seed=args.seed,
+                         report_every=args.report_every)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"\nA ({args.a}): {totals.describe(0)} per round")
+    print(f"B ({args.b}): {totals.describe(1)} per round")
+    print(f"A-B: {totals.describe()} after {totals.n} shoes in {time.perf_counter() - start:.1f}s")
+    # Independent runs would see the sum of both variances instead of the paired one
+    if totals.variance() > 0:
+        print(f"Common random numbers cut the samples needed by "
+              f"{(totals.variance(0) + totals.variance(1)) / totals.variance():.1f}x")
+    else:
+        print("A and B finished every shoe with the same net and rounds")
@@ -0,0 +1,174 @@
+# scripted.py
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+# --- Script Sources ---
+class ScriptExhausted(Exception):
+    """Raised when a scripted session runs out of input."""
+
+
+class ScriptedInput:
+    """Stands in for input(), answering prompts from a script.
+
+    The script is either an iterable of answer strings (a file's lines, a list,
+    a generator) or a callable that takes the prompt and returns the answer,
+    or None once the session is over.
+    """
+    def __init__(self, script, echo=False):
+        self.answer_for = script if callable(script) else None
+        self.answers = None if callable(script) else iter(script)
+        self.echo = echo
+        self.consumed = 0
+
+    def __call__(self, prompt=""):
+        if self.answer_for:
+            answer = self.answer_for(prompt)
+        else:
+            answer = next(self.answers, None)
+        if answer is None:
+            raise ScriptExhausted(prompt)
+        answer = answer.rstrip("\n")
+        self.consumed += 1
+        if self.echo:
+            print(f"{prompt}{answer}")
+        return answer
+
+
+def load_script(path):
+    """Reads one answer per line; lines starting with '#' are comments."""
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f if not line.startswith("#")]
+
+
+def random_player(rounds, seed=None):
+    """Returns a prompt-aware script that plays random legal-looking answers for both games."""
+    rng = random.Random(seed)
+    rounds_left = [rounds]
+
+    def answer_for(prompt):
+        text = prompt.lower()
+        if "number of players" in text:
+            return str(rng.randint(1, 5))
+        if "number of decks" in text:
+            return str(rng.randint(1, 8))
+        if "reshuffle" in text:
+            return str(rng.randint(10, 80))
+        if "bet" in text:
+            return "10"
+        if "insurance" in text:
+            return rng.choice("yn")
+        if "move" in text:
+            return rng.choice("hhsdp")
+        if "[h]it" in text:
+            return rng.choice("HHSSDTRC")
+        if prompt == "> ":
+            return rng.choice(["", "", "", "1", "2", "3"])
+        if "play another round" in text or "press enter" in text:
+            rounds_left[0] -= 1
+            if rounds_left[0] <= 0:
+                return None
+            return "y"
+        return ""
+
+    return answer_for
+
+# --- Running Sessions ---
+@contextmanager
+def no_delays():
+    """Disables time.sleep and screen clearing while scripted sessions run."""
+    sleep, system = time.sleep, os.system
+    time.sleep = lambda seconds: None
+    os.system = lambda command: 0
+    try:
+        yield
+    finally:
+        time.sleep, os.system = sleep, system
+
+
+def compile_game(path):
+    """Compiles a game script once so many sessions can reuse the code object."""
+    with open(path, encoding="utf-8") as f:
+        return compile(f.read(), path, "exec")
+
+
+def run_session(code, script, seed=None, echo=False):
+    """Runs one game session as __main__ with input() fed from script.
+
+    Returns (inputs consumed, seconds elapsed, error or None). Running out of
+    script ends the session normally.
+    """
+    feeder = ScriptedInput(script, echo=echo)
+    namespace = {"__name__": "__main__", "input": feeder}
+    if not echo:
+        namespace["print"] = lambda *args, **kwargs: None
+    if seed is not None:
+        random.seed(seed)
+
+    error = None
+    start = time.perf_counter()
+    try:
+        exec(code, namespace)
+    except ScriptExhausted:
+        pass
+    except Exception as e:
+        error = e
+    return feeder.consumed, time.perf_counter() - start, error
+
+
+def run_batch(path, scripts, seed=None, echo=False):
+    """Runs every script against the game at path back-to-back and collects results."""
+    code = compile_game(path)
+    results = []
+    with no_delays():
+        for i, script in enumerate(scripts):
+            session_seed = None if seed is None else seed + i
+            results.append(run_session(code, script, seed=session_seed, echo=echo))
+    return results
+
+
+def print_report(results, elapsed):
+    """Prints timing and error totals for a batch."""
+    durations = [r[1] for r in results]
+    inputs = sum(r[0] for r in results)
+    errors = [r[2] for r in results if r[2] is not None]
+    print(f"Sessions: {len(results)} in {elapsed:.2f}s ({len(results) / elapsed:,.1f}/s)")
+    print(f"Inputs:   {inputs} ({inputs / elapsed:,.0f}/s)")
+    if durations:
+        print(f"Session:  mean {statistics.mean(durations) * 1000:.2f}ms | "
+              f"median {statistics.median(durations) * 1000:.2f}ms | "
+              f"max {max(durations) * 1000:.2f}ms")
+    print(f"Errors:   {len(errors)}")
+    for e in errors[:5]:
+        print(f"  {type(e).__name__}: {e}")
+
+
+# --- Main ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run scripted sessions of a blackjack game.")
+    parser.add_argument("game", help="game script to drive, e.g. blackjack.py or blackjaque.py")
+    parser.add_argument("scripts", nargs="*", help="answer files, one input per line")
+    parser.add_argument("--repeat", type=int, default=1, help="times to run each script")
+    parser.add_argument("--random-sessions", type=int, default=0,
+                        help="additional sessions played by random_player")
+    parser.add_argument("--rounds", type=int, default=10, help="rounds per random session")
+    parser.add_argument("--seed", type=int, default=None, help="base seed for shuffles and random players")
+    parser.add_argument("--echo", action="store_true", help="show game output and answers")
+    args = parser.parse_args()
+
+    scripts = [load_script(p) for p in args.scripts] * args.repeat
+    for i in range(args.random_sessions):
+        player_seed = None if args.seed is None else args.seed + i
+        scripts.append(random_player(args.rounds, seed=player_seed))
+    if not scripts:
+        parser.error("give at least one script or --random-sessions")
+
+    start = time.perf_counter()
+    results = run_batch(args.game, scripts, seed=args.seed, echo=args.echo)
+    print_report(results, time.perf_counter() - start)
+    sys.exit(1 if any(r[2] is not None for r in results) else 0)
@@ -0,0 +1,345 @@
+# strategy_daemon.py
+
+import argparse
+import os
+import socket
+import socketserver
+import stat
+import time
+from functools import lru_cache
+
+from blackjack import VALUES, DEALER_HITS_ON_SOFT_17, Card, Hand, BlackjackGame
+from blackjaque import get_recommendation
+
+# --- Configuration ---
+SOCKET_PATH = "/tmp/blackjack-strategy.sock"
+CACHE_SIZE = 65536
+NUM_DECKS = 6
+CARD_VALUES = list(range(2, 12))  # Composition order: 2..9, ten-value, Ace
+OUTCOMES = ['17', '18', '19', '20', '21', 'bust']
+GAME = BlackjackGame()  # Only used for its strategy chart
+
+# --- Request Format ---
+# One request per line, fields separated by spaces; one response line per request.
+#   R <hand> <up>                   blackjack.py move, e.g. "OK Double Down"
+#   T <hand> <up>                   blackjaque strategy_table code, e.g. "OK D"
+#   D <up> [shoe] [rules]           dealer final totals, e.g. "OK 17=0.1307 ... bust=0.2310"
+#   E <hand> <up> [shoe] [rules]    EVs per unit bet, e.g. "OK stand=-0.29 hit=0.05 double=0.10 best=double";
+#                                   pairs add split=, splitting once with doubling allowed after
+#   STATS                           cache statistics
+# <hand> is comma-separated ranks (A,7). <shoe> is "6d" for six full decks or ten
+# comma-separated counts of 2..9, ten-value and Ace remaining. <rules> is H17 or S17.
+# Dealer totals and EVs assume the dealer has already checked for Blackjack.
+# Errors come back as "ERR <message>".
+
+def parse_hand(text):
+    ranks = ['10' if r == 'T' else r for r in text.upper().split(',')]
+    for r in ranks:
+        if r not in VALUES:
+            raise ValueError(f"unknown rank {r!r}")
+    return tuple(sorted(ranks))
+
+
+def parse_shoe(text):
+    if text.lower().endswith('d'):
+        decks = int(text[:-1])
+        if decks < 1:
+            raise ValueError("shoe needs at least one deck")
+        return tuple([4 * decks] * 8 + [16 * decks, 4 * decks])
+    counts = tuple(int(c) for c in text.split(','))
+    if len(counts) != len(CARD_VALUES) or min(counts) < 0 or sum(counts) == 0:
+        raise ValueError("shoe needs ten non-negative counts for 2..9, ten-value and Ace")
+    return counts
+
+
+def parse_rules(text):
+    rules = text.upper()
+    if rules not in ('H17', 'S17'):
+        raise ValueError("rules must be H17 or S17")
+    return rules
+
+# --- Probabilities ---
+class ShoeSolver:
+    """Dealer and player EV tables for one shoe composition and rule set.
+
+    Cards are drawn with the composition's proportions throughout a hand.
+    Results are memoized, so a solver doubles as an in-memory precomputed table.
+    """
+    def __init__(self, shoe, rules):
+        total = sum(shoe)
+        self.probs = [(v, n / total) for v, n in zip(CARD_VALUES, shoe) if n]
+        self.hits_soft_17 = rules == 'H17'
+        self._finish = {}
+        self._dealer = {}
+        self._best = {}
+
+    @staticmethod
+    def add(total, soft_aces, value):
+        """Adds a card value to a (total, soft aces) hand, counting aces as 1 when needed."""
+        total += value
+        soft_aces += value == 11
+        while total > 21 and soft_aces:
+            total -= 10
+            soft_aces -= 1
+        return total, soft_aces
+
+    def finish(self, total, soft_aces):
+        """Distribution over OUTCOMES for a dealer hand that keeps drawing from here."""
+        key = (total, soft_aces)
+        if key in self._finish:
+            return self._finish[key]
+        if total > 21:
+            result = (0, 0, 0, 0, 0, 1)
+        elif total > 17 or (total == 17 and not (soft_aces and self.hits_soft_17)):
+            result = tuple(1 if i == total - 17 else 0 for i in range(6))
+        else:
+            result = [0] * 6
+            for value, p in self.probs:
+                for i, q in enumerate(self.finish(*self.add(total, soft_aces, value))):
+                    result[i] += p * q
+            result = tuple(result)
+        self._finish[key] = result
+        return result
+
+    def dealer(self, up):
+        """Distribution over OUTCOMES for an up card, given the dealer has no Blackjack."""
+        if up in self._dealer:
+            return self._dealer[up]
+        result, weight = [0] * 6, 0
+        for value, p in self.probs:
+            if up + value == 21:
+                continue # The hole card can't complete a Blackjack
+            weight += p
+            for i, q in enumerate(self.finish(*self.add(up, up == 11, value))):
+                result[i] += p * q
+        if weight == 0:
+            raise ValueError("every hole card gives the dealer Blackjack")
+        result = tuple(r / weight for r in result)
+        self._dealer[up] = result
+        return result
+
+    def stand(self, total, up):
+        if total > 21:
+            return -1
+        dist = self.dealer(up)
+        win = dist[5] + sum(dist[i] for i in range(5) if 17 + i < total)
+        lose = sum(dist[i] for i in range(5) if 17 + i > total)
+        return win - lose
+
+    def best(self, total, soft_aces, up):
+        """EV of playing on optimally (hit or stand) from a hand."""
+        key = (total, soft_aces, up)
+        if key in self._best:
+            return self._best[key]
+        if total > 21:
+            result = -1
+        else:
+            result = max(self.stand(total, up), self.hit(total, soft_aces, up))
+        self._best[key] = result
+        return result
+
+    def hit(self, total, soft_aces, up):
+        if total > 21:
+            return -1
+        return sum(p * self.best(*self.add(total, soft_aces, value), up) for value, p in self.probs)
+
+    def double(self, total, soft_aces, up):
+        return 2 * sum(p * self.stand(self.add(total, soft_aces, value)[0], up) for value, p in self.probs)
+
+    def split(self, value, up):
+        """EV of splitting a pair once, as blackjack.py plays split hands (aces included).
+
+        Each hand is dealt its second card and then stands, hits or doubles,
+        whichever is best; resplits are not considered.
+        """
+        first = self.add(0, 0, value)
+        ev = 0
+        for second, p in self.probs:
+            total, soft_aces = self.add(*first, second)
+            ev += p * max(self.stand(total, up), self.hit(total, soft_aces, up),
+                          self.double(total, soft_aces, up))
+        return 2 * ev
+
+
+@lru_cache(maxsize=64)
+def solver_for(shoe, rules):
+    """Keeps the solvers for the most recently queried ad-hoc shoes and rules in memory."""
+    return ShoeSolver(shoe, rules)
+
+
+def hand_state(ranks):
+    total, soft_aces = 0, 0
+    for r in ranks:
+        total, soft_aces = ShoeSolver.add(total, soft_aces, VALUES[r])
+    return total, soft_aces
+
+# --- Queries ---
+def query(command, hand, up, solver):
+    """Answers one parsed request from a shoe's solver (None for R and T)."""
+    if command == 'R':
+        player_hand = Hand(0)
+        for r in hand:
+            player_hand.add_card(Card('♠', r))
+        return GAME.get_recommended_move(player_hand, Card('♠', up))
+    if command == 'T':
+        return get_recommendation(list(hand), up)
+
+    up_value = VALUES[up]
+    if command == 'D':
+        return ' '.join(f"{o}={p:.4f}" for o, p in zip(OUTCOMES, solver.dealer(up_value)))
+    if command == 'E':
+        total, soft_aces = hand_state(hand)
+        if len(hand) == 2 and total == 21:
+            return "blackjack=1.5000 best=stand"
+        evs = {'stand': solver.stand(total, up_value), 'hit': solver.hit(total, soft_aces, up_value)}
+        if len(hand) == 2:
+            evs['double'] = solver.double(total, soft_aces, up_value)
+            if hand[0] == hand[1]:
+                evs['split'] = solver.split(VALUES[hand[0]], up_value)
+        best = max(evs, key=evs.get)
+        return ' '.join(f"{k}={v:.4f}" for k, v in evs.items()) + f" best={best}"
+    raise ValueError(f"unknown command {command!r}")
+
+
+class StrategyService:
+    """Parses request lines and answers them through a bounded LRU cache.
+
+    The default shoe's solvers are pinned for the life of the service, so
+    queries on many ad-hoc shoes never evict its precomputed tables.
+    """
+    def __init__(self, cache_size=CACHE_SIZE, num_decks=NUM_DECKS):
+        self.default_shoe = parse_shoe(f"{num_decks}d")
+        self.default_rules = 'H17' if DEALER_HITS_ON_SOFT_17 else 'S17'
+        self.solvers = {rules: ShoeSolver(self.default_shoe, rules) for rules in ('H17', 'S17')}
+        self.query = lru_cache(maxsize=cache_size)(self.answer)
+        self.precompute()
+
+    def answer(self, command, hand, up, shoe, rules):
+        """Answers a parsed request with the pinned solver for the default shoe or solver_for's."""
+        solver = None
+        if shoe == self.default_shoe:
+            solver = self.solvers[rules]
+        elif shoe is not None:
+            solver = solver_for(shoe, rules)
+        return query(command, hand, up, solver)
+
+    def precompute(self):
+        """Fills the default shoe's dealer and EV tables for every up card under both rules."""
+        for solver in self.solvers.values():
+            for up in CARD_VALUES:
+                solver.dealer(up)
+                for total in range(4, 22):
+                    solver.best(total, 0, up)
+                    if total >= 12:
+                        solver.best(total, 1, up)
+
+    def handle(self, line):
+        """Returns the response line for a request line."""
+        fields = line.split()
+        if not fields:
+            return "ERR empty request"
+        command = fields[0].upper()
+        try:
+            if command == 'STATS':
+                info = self.query.cache_info()
+                return f"OK hits={info.hits} misses={info.misses} size={info.currsize}/{info.maxsize}"
+            if command not in ('R', 'T', 'D', 'E'):
+                raise ValueError(f"unknown command {command!r}")
+            if command == 'D':
+                hand, rest = (), fields[1:]
+            else:
+                hand, rest = parse_hand(fields[1]), fields[2:]
+            up_ranks = parse_hand(rest[0])
+            if len(up_ranks) != 1:
+                raise ValueError("up card must be a single rank")
+            up = up_ranks[0]
+            shoe = parse_shoe(rest[1]) if len(rest) > 1 else self.default_shoe
+            rules = parse_rules(rest[2]) if len(rest) > 2 else self.default_rules
+            if command in ('R', 'T'):
+                shoe, rules = None, None # Fixed charts don't depend on the shoe
+            return f"OK {self.query(command, hand, up, shoe, rules)}"
+        except IndexError:
+            return "ERR missing field"
+        except ValueError as e:
+            return f"ERR {e}"
+
+# --- Server & Client ---
+class StrategyRequestHandler(socketserver.StreamRequestHandler):
+    """Answers request lines on one connection until the client hangs up."""
+    def handle(self):
+        for line in self.rfile:
+            response = self.server.service.handle(line.decode("utf-8", "replace"))
+            self.wfile.write(response.encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class StrategyServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, service):
+        if os.path.lexists(path):
+            if not stat.S_ISSOCK(os.lstat(path).st_mode):
+                raise FileExistsError(f"{path} exists and is not a socket")
+            os.unlink(path) # Stale socket from a previous run
+        self.service = service
+        super().__init__(path, StrategyRequestHandler)
+
+
+class StrategyClient:
+    """Keeps one connection to the daemon open for back-to-back queries."""
+    def __init__(self, path=SOCKET_PATH):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.rfile = self.sock.makefile("rb")
+
+    def ask(self, request):
+        """Sends one request line and returns the response line without its newline."""
+        self.sock.sendall(request.encode("utf-8") + b"\n")
+        return self.rfile.readline().decode("utf-8").rstrip("\n")
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+
+# --- Main ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve strategy, dealer and EV queries over a Unix socket.")
+    parser.add_argument("mode", choices=["serve", "ask", "bench"])
+    parser.add_argument("request", nargs="*", help="request fields for ask, e.g. E A,7 6")
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE)
+    parser.add_argument("-n", type=int, default=10000, help="queries to time in bench mode")
+    args = parser.parse_intermixed_args()
+
+    if args.mode == "serve":
+        start = time.perf_counter()
+        try:
+            server = StrategyServer(args.socket, StrategyService(args.cache_size))
+        except FileExistsError as e:
+            parser.error(str(e))
+        print(f"Ready on {args.socket} after {(time.perf_counter() - start) * 1000:.0f}ms")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            os.unlink(args.socket)
+    else:
+        client = StrategyClient(args.socket)
+        if args.mode == "ask":
+            print(client.ask(' '.join(args.request)))
+        else:
+            requests = [f"{c} {a},{b} {u}" for c in "RTE" for a in "23456789TA"
+                        for b in "23456789TA" for u in "23456789TA"]
+            latencies = []
+            for i in range(args.n):
+                start = time.perf_counter()
+                client.ask(requests[i % len(requests)])
+                latencies.append(time.perf_counter() - start)
+            latencies.sort()
+            print(f"{args.n} queries: median {latencies[len(latencies) // 2] * 1e6:.0f}us | "
+                  f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.0f}us | "
+                  f"{args.n / sum(latencies):,.0f} queries/s")
+        client.close()
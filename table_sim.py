@@ -0,0 +1,536 @@
+# table_sim.py
+
+import contextlib
+import io
+import math
+import sys
+import time
+
+import numpy as np
+
+from blackjack import RANKS, VALUES, DEALER_HITS_ON_SOFT_17, Card, Deck, Player, Hand, BlackjackGame
+from scripted import no_delays
+
+# --- Configuration ---
+MIN_BET = 10
+SHUFFLE_PENETRATION = 0.25
+
+# Seat statuses, stored as int8 codes in SimTables.status
+OUT, PLAYING, STAND, BUST, BLACKJACK = 0, 1, 2, 3, 4
+
+# Strategy codes, stored as int8 codes in STRATEGY
+S, H, D = 0, 1, 2
+
+MAX_TOTAL = 32      # Largest total a hand can hold before soft aces are reduced (21 + 11)
+NUM_UPCARDS = 12    # Dealer up-card values are 2..11
+CARDS_PER_HAND = 4  # Cards reserved per hand (seats and dealer) behind the cut card; hands average under 3
+
+# Hi-Lo tag indexed by card value (ten-value cards and aces are both -1)
+HI_LO = np.zeros(NUM_UPCARDS, dtype=np.int8)
+HI_LO[2:7] = 1
+HI_LO[10:12] = -1
+
+# --- Strategy Table ---
+def build_strategy_table():
+    """Flattens BlackjackGame.get_recommended_move into a (soft, total, upcard) lookup array."""
+    game = BlackjackGame()
+    moves = {"Stand": S, "Hit": H, "Double Down": D}
+    table = np.full((2, MAX_TOTAL, NUM_UPCARDS), H, dtype=np.int8)
+    table[:, 21:, :] = S
+
+    # Representative non-pair hands for every hard and soft total
+    hard = {t: ['2', str(t - 2)] for t in range(5, 12)}
+    hard.update({t: ['10', str(t - 10)] for t in range(12, 20)})
+    hard[20] = ['K', 'Q']
+    hard[21] = ['10', '9', '2']
+    soft = {t: ['A', str(t - 11)] for t in range(13, 22)}
+
+    for is_soft, hands in ((0, hard), (1, soft)):
+        for total, ranks in hands.items():
+            hand = Hand(0)
+            for rank in ranks:
+                hand.add_card(Card('♠', rank))
+            for up_rank in RANKS:
+                move = game.get_recommended_move(hand, Card('♠', up_rank))
+                table[is_soft, total, VALUES[up_rank]] = moves.get(move, H)
+    return table.ravel()
+
+STRATEGY = build_strategy_table()
+
+# --- Classes ---
+class SimTables:
+    """A bank of simulation tables that keeps every seat in preallocated struct-of-arrays state.
+
+    Seat state is stored as (num_tables, num_seats) arrays and dealer and shoe
+    state as per-table rows. Each phase of a round (betting, dealing, playing,
+    settling) steps every seat of every due table together with in-place NumPy
+    operations, so a round allocates no new arrays. Seats play one hand each the
+    way BlackjackGame.cpu_turn does, except that pairs are played as their
+    totals rather than split; check_against_game replays shoes through both.
+
+    The cards left at the cut card must cover a whole round, so a shoe never
+    runs out mid-round. num_decks=None picks the smallest shoe of at least six
+    decks that does; an explicit num_decks that is too small raises ValueError.
+
+    Memory is about 36 bytes per seat plus one byte per shoe card per table:
+    1000 tables x 300 seats (93-deck shoes) take about 16 MB, most of it the
+    per-seat wallets, bets and phase state that every seat needs.
+    """
+    def __init__(self, num_seats, num_tables=1, num_decks=None,
+                 shuffle_penetration=SHUFFLE_PENETRATION, wallet=1000, stake=MIN_BET, seed=None):
+        needed = CARDS_PER_HAND * (num_seats + 1)
+        if num_decks is None:
+            num_decks = max(6, math.ceil(needed / (52 * shuffle_penetration)))
+        if 52 * num_decks * shuffle_penetration < needed:
+            raise ValueError(f"A {num_decks}-deck shoe cut at {shuffle_penetration:.0%} can't cover "
+                             f"a round for {num_seats} seats ({needed} cards).")
+        self.num_tables = num_tables
+        self.num_seats = num_seats
+        self.num_decks = num_decks
+        self.shuffle_penetration = shuffle_penetration
+        self.rng = np.random.default_rng(seed)
+        seats = (num_tables, num_seats)
+
+        # Seat state
+        self.wallets = np.full(seats, wallet, dtype=np.float32) # Exact in half-dollars up to $8M
+        self.stakes = np.full(seats, stake, dtype=np.float32)
+        self.active = np.ones(seats, dtype=bool)
+        self.bets = np.zeros(seats, dtype=np.float32)
+        self.insurance = np.zeros(seats, dtype=np.float32)
+        self.totals = np.zeros(seats, dtype=np.int8)
+        self.soft_aces = np.zeros(seats, dtype=np.int8)
+        self.aces = np.zeros(seats, dtype=np.int8)
+        self.ncards = np.zeros(seats, dtype=np.int8)
+        self.status = np.zeros(seats, dtype=np.int8)
+
+        # Dealer state
+        self.dealer_up = np.zeros(num_tables, dtype=np.int8)
+        self.dealer_total = np.zeros(num_tables, dtype=np.int8)
+        self.dealer_soft_aces = np.zeros(num_tables, dtype=np.int8)
+        self.dealer_aces = np.zeros(num_tables, dtype=np.int8)
+        self.dealer_ncards = np.zeros(num_tables, dtype=np.int8)
+
+        # Shoes of card values, one row per table. Each row ends in one spare
+        # slot that seats and dealers left out of a deal index into harmlessly.
+        deck = np.array([VALUES[r] for r in RANKS] * 4, dtype=np.int8)
+        self.shoe_size = deck.size * num_decks
+        self._shoe_rows = np.zeros((num_tables, self.shoe_size + 1), dtype=np.int8)
+        self.shoe = self._shoe_rows[:, :self.shoe_size]
+        self.shoe[:] = np.tile(deck, num_decks)
+        self._shoe_flat = self._shoe_rows.reshape(-1)
+        self.pos = np.zeros(num_tables, dtype=np.int32)
+        self._shoe_base = np.arange(num_tables, dtype=np.int32) * (self.shoe_size + 1)
+
+        # Hi-Lo running count of every card dealt since the shuffle, and the
+        # dealer's hole card so insurance can leave it out
+        self._count = np.zeros(num_tables, dtype=np.int32)
+        self.dealer_hole = np.zeros(num_tables, dtype=np.int8)
+
+        # Scratch buffers reused by every phase
+        self._idx = np.zeros(seats, dtype=np.int32)
+        self._cards = np.zeros(seats, dtype=np.int8)
+        self._codes = np.zeros(seats, dtype=np.int8)
+        self._payout = np.zeros(seats, dtype=np.float32)
+        self._play = np.zeros(seats, dtype=bool)
+        self._dbl = np.zeros(seats, dtype=bool)
+        self._scratch = np.zeros(seats, dtype=bool)
+        self._ace = np.zeros(seats, dtype=bool)
+        self._t_idx = np.zeros(num_tables, dtype=np.int32)
+        self._t_cards = np.zeros(num_tables, dtype=np.int8)
+        self._t_tag = np.zeros(num_tables, dtype=np.int8)
+        self._t_rc = np.zeros(num_tables, dtype=np.int32)
+        self._t_count = np.zeros(num_tables, dtype=np.float64)
+        self._t_pay = np.zeros(num_tables, dtype=np.float32)
+        self._t_due = np.zeros(num_tables, dtype=bool)
+        self._t_hit = np.zeros(num_tables, dtype=bool)
+        self._t_bj = np.zeros(num_tables, dtype=bool)
+        self._t_bust = np.zeros(num_tables, dtype=bool)
+        self._t_scratch = np.zeros(num_tables, dtype=bool)
+        self._t_ace = np.zeros(num_tables, dtype=bool)
+        self._t_over = np.zeros(num_tables, dtype=bool)
+
+        self.rounds = np.zeros(num_tables, dtype=np.int64)
+        for table in range(num_tables):
+            self.shuffle(table)
+
+    @property
+    def nbytes(self):
+        """Total bytes held by the bank's arrays."""
+        return sum(a.nbytes for a in vars(self).values()
+                   if isinstance(a, np.ndarray) and a.base is None)
+
+    @property
+    def cards_remaining(self):
+        return self.shoe_size - self.pos
+
+    @property
+    def running_count(self):
+        """The Hi-Lo running count of every card dealt at each table since its last shuffle."""
+        return self._count.copy()
+
+    def get_true_count(self):
+        """Calculates the true count at every table."""
+        self._true_counts(self._t_count)
+        return self._t_count.copy()
+
+    def _true_counts(self, out, hole_hidden=False):
+        """True counts into out, leaving the dealer's hole card out when hole_hidden."""
+        np.copyto(self._t_rc, self._count)
+        if hole_hidden:
+            np.take(HI_LO, self.dealer_hole, out=self._t_tag)
+            np.subtract(self._t_rc, self._t_tag, out=self._t_rc)
+        np.subtract(self.shoe_size, self.pos, out=self._t_idx)
+        np.greater(self._t_idx, 0, out=self._t_scratch)
+        out.fill(0)
+        np.divide(self._t_rc, self._t_idx, out=out, where=self._t_scratch)
+        np.multiply(out, 52, out=out)
+
+    def shuffle(self, table):
+        """Shuffles one table's shoe in place and resets its running count."""
+        self.rng.shuffle(self.shoe[table])
+        self._count[table] = 0
+        self.pos[table] = 0
+
+    def _shuffle_where(self, mask):
+        for table in np.flatnonzero(mask):
+            self.shuffle(table)
+
+    def _reduce_aces(self, totals, soft_aces, over, ace):
+        """Counts soft aces as 1 wherever a total went over 21; a new ace can need this twice."""
+        for _ in range(2):
+            np.greater(totals, 21, out=over)
+            np.greater(soft_aces, 0, out=ace)
+            np.logical_and(over, ace, out=over)
+            np.subtract(totals, 10, out=totals, where=over)
+            np.subtract(soft_aces, 1, out=soft_aces, where=over)
+
+    def _deal_to(self, mask):
+        """Deals one card to every seat in mask and folds it into the totals."""
+        # Reshuffle any shoe that would run out (same as Deck.deal on an empty deck);
+        # the cut card leaves enough cards that this is only a safeguard
+        np.add.reduce(mask, axis=1, dtype=np.int32, out=self._t_idx)
+        np.add(self._t_idx, self.pos, out=self._t_idx)
+        np.greater(self._t_idx, self.shoe_size, out=self._t_scratch)
+        if self._t_scratch.any():
+            self._shuffle_where(self._t_scratch)
+
+        # The n-th seat in mask at a table takes the n-th card from the top of its
+        # shoe. Seats outside mask read the next card, at most the spare slot.
+        np.cumsum(mask, axis=1, out=self._idx, dtype=np.int32)
+        np.subtract(self._idx, mask, out=self._idx)
+        np.add(self._shoe_base, self.pos, out=self._t_idx)
+        np.add(self._idx, self._t_idx[:, None], out=self._idx)
+        np.take(self._shoe_flat, self._idx, out=self._cards)
+        np.add.reduce(mask, axis=1, dtype=np.int32, out=self._t_idx)
+        np.add(self.pos, self._t_idx, out=self.pos)
+        np.take(HI_LO, self._cards, out=self._codes)
+        np.add.reduce(self._codes, axis=1, dtype=np.int32, out=self._t_idx, where=mask)
+        np.add(self._count, self._t_idx, out=self._count)
+
+        np.add(self.totals, self._cards, out=self.totals, where=mask)
+        np.add(self.ncards, 1, out=self.ncards, where=mask)
+        np.equal(self._cards, 11, out=self._ace)
+        np.logical_and(self._ace, mask, out=self._ace)
+        np.add(self.soft_aces, 1, out=self.soft_aces, where=self._ace)
+        np.add(self.aces, 1, out=self.aces, where=self._ace)
+        self._reduce_aces(self.totals, self.soft_aces, self._scratch, self._ace)
+
+    def _deal_to_dealers(self, mask):
+        """Deals one card to the dealer of every table in mask."""
+        np.greater_equal(self.pos, self.shoe_size, out=self._t_scratch)
+        np.logical_and(self._t_scratch, mask, out=self._t_scratch)
+        if self._t_scratch.any():
+            self._shuffle_where(self._t_scratch)
+
+        np.add(self._shoe_base, self.pos, out=self._t_idx)
+        np.take(self._shoe_flat, self._t_idx, out=self._t_cards)
+        np.add(self.pos, mask, out=self.pos, casting='unsafe')
+        np.take(HI_LO, self._t_cards, out=self._t_tag)
+        np.add(self._count, self._t_tag, out=self._count, where=mask)
+
+        np.add(self.dealer_total, self._t_cards, out=self.dealer_total, where=mask)
+        np.add(self.dealer_ncards, 1, out=self.dealer_ncards, where=mask)
+        np.equal(self._t_cards, 11, out=self._t_ace)
+        np.logical_and(self._t_ace, mask, out=self._t_ace)
+        np.add(self.dealer_soft_aces, 1, out=self.dealer_soft_aces, where=self._t_ace)
+        np.add(self.dealer_aces, 1, out=self.dealer_aces, where=self._t_ace)
+        self._reduce_aces(self.dealer_total, self.dealer_soft_aces, self._t_over, self._t_ace)
+
+    def place_bets(self, due):
+        """Handles the betting phase for all seats at the due tables."""
+        rows = due[:, None]
+        for a in (self.totals, self.soft_aces, self.aces, self.ncards, self.insurance, self.bets):
+            np.copyto(a, 0, where=rows)
+        np.copyto(self.status, OUT, where=rows)
+
+        # Seated players who can cover their stake are in the round
+        np.greater_equal(self.wallets, self.stakes, out=self._play)
+        np.greater_equal(self.stakes, MIN_BET, out=self._scratch)
+        np.logical_and(self._play, self._scratch, out=self._play)
+        np.logical_and(self._play, self.active, out=self._play)
+        np.logical_and(self._play, rows, out=self._play)
+
+        np.copyto(self.bets, self.stakes, where=self._play)
+        np.subtract(self.wallets, self.bets, out=self.wallets, where=self._play)
+        np.copyto(self.status, PLAYING, where=self._play)
+
+    def deal_initial_cards(self, due):
+        """Deals two cards to each seat in the round and to the dealers of the due tables."""
+        for a in (self.dealer_total, self.dealer_soft_aces, self.dealer_aces, self.dealer_ncards):
+            np.copyto(a, 0, where=due)
+        np.equal(self.status, PLAYING, out=self._play)
+        self._deal_to(self._play)
+        self._deal_to_dealers(due)
+        np.copyto(self.dealer_up, self.dealer_total, where=due)
+        self._deal_to(self._play)
+        self._deal_to_dealers(due)
+        np.copyto(self.dealer_hole, self._t_cards, where=due)
+
+        np.equal(self.totals, 21, out=self._scratch)
+        np.logical_and(self._scratch, self._play, out=self._scratch)
+        np.copyto(self.status, BLACKJACK, where=self._scratch)
+
+    def offer_insurance(self, due):
+        """CPU seats take insurance when the dealer shows an Ace and the true count is high."""
+        # The hole card stays face down until dealer_turn
+        self._true_counts(self._t_count, hole_hidden=True)
+        np.greater_equal(self._t_count, 3, out=self._t_scratch)
+        np.logical_and(self._t_scratch, due, out=self._t_scratch)
+        np.equal(self.dealer_up, 11, out=self._t_ace)
+        np.logical_and(self._t_scratch, self._t_ace, out=self._t_scratch)
+        if not self._t_scratch.any():
+            return
+
+        np.equal(self.status, PLAYING, out=self._play)
+        np.logical_and(self._play, self._t_scratch[:, None], out=self._play)
+        np.multiply(self.bets, 0.5, out=self.insurance, where=self._play)
+        np.greater_equal(self.wallets, self.insurance, out=self._scratch)
+        np.logical_and(self._play, self._scratch, out=self._play)
+        np.multiply(self.insurance, self._play, out=self.insurance)
+        np.subtract(self.wallets, self.insurance, out=self.wallets)
+
+    def check_dealer_blackjack(self, due):
+        """Ends the round for every seat at tables where the dealer has Blackjack."""
+        np.equal(self.dealer_total, 21, out=self._t_bj)
+        np.logical_and(self._t_bj, due, out=self._t_bj)
+        np.equal(self.status, PLAYING, out=self._scratch)
+        np.logical_and(self._scratch, self._t_bj[:, None], out=self._scratch)
+        np.copyto(self.status, STAND, where=self._scratch)
+
+    def play_seats(self):
+        """Plays every seat's hand by basic strategy, one card per seat per step."""
+        while True:
+            np.equal(self.status, PLAYING, out=self._play)
+            if not self._play.any():
+                return
+
+            # Flat index into STRATEGY: (soft * MAX_TOTAL + total) * NUM_UPCARDS + upcard.
+            # Like get_recommended_move, any hand holding an ace plays as soft.
+            np.greater(self.aces, 0, out=self._ace)
+            np.multiply(self._ace, MAX_TOTAL, out=self._idx, dtype=np.int32)
+            np.add(self._idx, self.totals, out=self._idx, dtype=np.int32)
+            np.multiply(self._idx, NUM_UPCARDS, out=self._idx)
+            np.add(self._idx, self.dealer_up[:, None], out=self._idx, dtype=np.int32)
+            np.take(STRATEGY, self._idx, out=self._codes)
+
+            # Stand
+            np.equal(self._codes, S, out=self._scratch)
+            np.logical_and(self._scratch, self._play, out=self._scratch)
+            np.copyto(self.status, STAND, where=self._scratch)
+
+            # Double down on two cards if the wallet covers it, otherwise stand
+            np.equal(self._codes, D, out=self._dbl)
+            np.logical_and(self._dbl, self._play, out=self._dbl)
+            np.copyto(self.status, STAND, where=self._dbl)
+            np.equal(self.ncards, 2, out=self._scratch)
+            np.logical_and(self._dbl, self._scratch, out=self._dbl)
+            np.greater_equal(self.wallets, self.bets, out=self._scratch)
+            np.logical_and(self._dbl, self._scratch, out=self._dbl)
+            np.subtract(self.wallets, self.bets, out=self.wallets, where=self._dbl)
+            np.multiply(self.bets, 2, out=self.bets, where=self._dbl)
+
+            # Everyone still playing hits, along with the doubles
+            np.equal(self.status, PLAYING, out=self._play)
+            np.logical_or(self._play, self._dbl, out=self._play)
+            self._deal_to(self._play)
+
+            np.greater(self.totals, 21, out=self._scratch)
+            np.copyto(self.status, BUST, where=self._scratch)
+            np.equal(self.totals, 21, out=self._scratch)
+            np.logical_and(self._scratch, self._play, out=self._scratch)
+            np.copyto(self.status, STAND, where=self._scratch)
+
+    def dealer_turn(self, due):
+        """Plays out the dealers of the due tables that did not have Blackjack."""
+        hits_soft_17 = 17 if DEALER_HITS_ON_SOFT_17 else 16
+        while True:
+            # Hit below 17, or on 17 with an ace when DEALER_HITS_ON_SOFT_17
+            np.less_equal(self.dealer_total, hits_soft_17, out=self._t_scratch)
+            np.greater(self.dealer_aces, 0, out=self._t_ace)
+            np.logical_and(self._t_scratch, self._t_ace, out=self._t_scratch)
+            np.less(self.dealer_total, 17, out=self._t_over)
+            np.logical_or(self._t_scratch, self._t_over, out=self._t_scratch)
+            np.logical_and(self._t_scratch, due, out=self._t_scratch)
+            np.logical_not(self._t_bj, out=self._t_over)
+            np.logical_and(self._t_scratch, self._t_over, out=self._t_scratch)
+            if not self._t_scratch.any():
+                return
+            np.copyto(self._t_hit, self._t_scratch)
+            self._deal_to_dealers(self._t_hit)
+
+    def settle_bets(self, due):
+        """Compares hands and settles all bets at the due tables."""
+        rows = due[:, None]
+        np.greater(self.dealer_total, 21, out=self._t_bust)
+
+        # Settle insurance first
+        np.multiply(self.insurance, 3, out=self._payout)
+        np.add(self.wallets, self._payout, out=self.wallets, where=self._t_bj[:, None])
+
+        self._payout.fill(0)
+        np.equal(self.status, STAND, out=self._play)
+        np.logical_and(self._play, rows, out=self._play)
+        np.greater(self.totals, self.dealer_total[:, None], out=self._scratch)
+        np.logical_or(self._scratch, self._t_bust[:, None], out=self._scratch)
+        np.logical_and(self._scratch, self._play, out=self._scratch)
+        np.copyto(self._payout, 2, where=self._scratch)
+        np.equal(self.totals, self.dealer_total[:, None], out=self._scratch)
+        np.logical_and(self._scratch, self._play, out=self._scratch)
+        np.copyto(self._payout, 1, where=self._scratch)
+
+        # Blackjack pays 3:2, or pushes against a dealer Blackjack
+        np.copyto(self._t_pay, 2.5)
+        np.copyto(self._t_pay, 1, where=self._t_bj)
+        np.equal(self.status, BLACKJACK, out=self._scratch)
+        np.logical_and(self._scratch, rows, out=self._scratch)
+        np.copyto(self._payout, self._t_pay[:, None], where=self._scratch)
+
+        np.multiply(self._payout, self.bets, out=self._payout)
+        np.add(self.wallets, self._payout, out=self.wallets)
+
+    def play_round(self, due=None):
+        """Executes a single round at every table in due (all tables by default)."""
+        if due is None:
+            self._t_due.fill(True)
+        else:
+            np.copyto(self._t_due, due)
+        due = self._t_due
+
+        # 1. Check for reshuffle
+        np.less(self.cards_remaining, self.shoe_size * self.shuffle_penetration, out=self._t_scratch)
+        np.logical_and(self._t_scratch, due, out=self._t_scratch)
+        if self._t_scratch.any():
+            self._shuffle_where(self._t_scratch)
+
+        # 2. Place bets and deal
+        self.place_bets(due)
+        self.deal_initial_cards(due)
+
+        # 3. Insurance and dealer blackjack
+        self.offer_insurance(due)
+        self.check_dealer_blackjack(due)
+
+        # 4. Seats, dealers, settle
+        self.play_seats()
+        self.dealer_turn(due)
+        self.settle_bets(due)
+        np.add(self.rounds, due, out=self.rounds)
+
+
+# --- Check ---
+class _NoSplitHand(Hand):
+    def can_split(self):
+        return False
+
+
+class _ReferenceGame(BlackjackGame):
+    """A BlackjackGame with one CPU player, dealing a SimTables shoe in the same order."""
+    def __init__(self, shoe, num_decks, shuffle_penetration):
+        super().__init__()
+        self.settings = {'num_decks': num_decks, 'num_players': 2,
+                         'shuffle_penetration': shuffle_penetration}
+        self.shoe = [int(v) for v in shoe]
+        ranks = {VALUES[r]: r for r in RANKS}
+        self.deck = Deck(num_decks)
+        self.deck.cards = [Card('♠', ranks[v]) for v in reversed(self.shoe)] # Dealt from the end
+        self.deck.rank_counts = [sum(c.rank == r for c in self.deck.cards) for r in RANKS]
+        self.initial_deck_size = len(self.deck.cards)
+        self.players = [Player("CPU 1"), self.dealer]
+
+    def get_recommended_move(self, player_hand, dealer_up_card):
+        """Plays pairs as their totals, as SimTables does."""
+        hand = _NoSplitHand(player_hand.bet)
+        hand.cards = player_hand.cards
+        return super().get_recommended_move(hand, dealer_up_card)
+
+    def insurance_ev(self):
+        """SimTables' rule: insure at a true count of +3, with the hole card still face down."""
+        seen = self.shoe[:self.initial_deck_size - len(self.deck.cards) - 1]
+        running_count = sum(int(HI_LO[v]) for v in seen)
+        return 1 if running_count / (len(self.deck.cards) / 52) >= 3 else -1
+
+    def play_cpu_round(self):
+        """Steps 2-8 of play_round, which would otherwise end the game without a human."""
+        for p in self.players:
+            p.clear_hands()
+        self.place_bets()
+        self.deal_initial_cards()
+        if self.dealer.hands[0].cards[0].rank == 'A':
+            self.offer_insurance()
+        if not self.dealer.hands[0].is_blackjack():
+            player = self.players[0]
+            for hand in player.hands:
+                if hand.status != 'blackjack':
+                    self.cpu_turn(player, hand)
+            self.dealer_turn()
+        self.settle_bets()
+
+
+def check_against_game(num_tables=100, seed=0):
+    """Plays each table's first shoe in SimTables and in BlackjackGame; returns the rounds that differ.
+
+    Every table seats one CPU player so both engines deal the same cards in
+    the same order. Each mismatch is (table, round, game result, SimTables
+    result), where a result is (wallet, dealer total, cards dealt).
+    """
+    tables = SimTables(1, num_tables, seed=seed)
+    mismatches = []
+    with no_delays(), contextlib.redirect_stdout(io.StringIO()):
+        games = [_ReferenceGame(tables.shoe[t], tables.num_decks, tables.shuffle_penetration)
+                 for t in range(num_tables)]
+        # Stop before any table reaches its cut card and reshuffles
+        while (tables.cards_remaining >= tables.shoe_size * tables.shuffle_penetration).all():
+            tables.play_round()
+            for t, game in enumerate(games):
+                game.play_cpu_round()
+                expected = (float(game.players[0].wallet), game.dealer.hands[0].get_value(),
+                            game.initial_deck_size - len(game.deck.cards))
+                actual = (float(tables.wallets[t, 0]), int(tables.dealer_total[t]), int(tables.pos[t]))
+                if expected != actual:
+                    mismatches.append((t, int(tables.rounds[t]), expected, actual))
+    return mismatches
+
+
+# --- Benchmark ---
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["check"]:
+        num_tables = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+        mismatches = check_against_game(num_tables)
+        for mismatch in mismatches[:10]:
+            print("Table %d, round %d: BlackjackGame %s, SimTables %s" % mismatch)
+        print(f"{len(mismatches)} mismatched rounds over {num_tables} shoes")
+        sys.exit(1 if mismatches else 0)
+
+    num_seats = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    num_tables = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    num_rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    tables = SimTables(num_seats, num_tables, seed=1)
+    print(f"{tables.num_decks}-deck shoes")
+    start = time.perf_counter()
+    for _ in range(num_rounds):
+        tables.play_round()
+    elapsed = time.perf_counter() - start
+    hands = num_seats * num_tables * num_rounds
+    print(f"{num_tables} tables x {num_seats} seats x {num_rounds} rounds in {elapsed:.2f}s "
+          f"({hands / elapsed:,.0f} hands/s, {tables.nbytes:,} bytes of table state)")
+    print(f"Mean wallet: ${tables.wallets.mean():.2f}")
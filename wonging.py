@@ -0,0 +1,171 @@
+# wonging.py
+
+import argparse
+import time
+
+import numpy as np
+
+from table_sim import SimTables, MIN_BET, OUT
+
+# --- Configuration ---
+SECONDS_PER_ROUND = 10  # Shuffle-free overhead of dealing and settling a round
+SECONDS_PER_SEAT = 7    # Extra time each occupied seat adds to a round
+COUNTER_SEAT = 0        # Seat kept free at every table for a counter to wong into
+TICK = 5                # Rounds ending within this many seconds of each other are played as one batch
+BANKROLL = 1_000_000    # No seat runs dry, so tables keep their players and results measure the strategy alone
+
+# --- Classes ---
+class Counter:
+    """A back-counter who watches one table, wongs in above entry and leaves below exit."""
+    def __init__(self, name, entry, exit, unit=MIN_BET, max_units=8):
+        self.name = name
+        self.entry = entry
+        self.exit = exit
+        self.unit = unit
+        self.max_units = max_units
+        self.table = None
+        self.seated = False
+        self.hands = 0
+        self.net = 0.0
+        self.hops = 0
+
+    def bet_for(self, true_count):
+        """Bets one unit per point of true count, between 1 and max_units."""
+        return self.unit * min(self.max_units, max(1, int(true_count)))
+
+
+class WongScheduler:
+    """Steps many tables in one event loop while counters hop between them.
+
+    Every table finishes rounds on its own simulated clock. The loop advances
+    to the next round end and plays, in one batch, every table whose round
+    ends within TICK seconds of it. After each round the counter watching a
+    table checks the true count to sit down, leave, or hop to the unwatched
+    table with the best count (as called in by team spotters).
+    """
+    def __init__(self, num_tables, num_counters, seats_per_table=5, entry=2, exit=0,
+                 unit=MIN_BET, max_units=8, num_decks=6, seed=None):
+        if num_counters > num_tables:
+            raise ValueError("Each counter needs a table of their own to watch.")
+        self.tables = SimTables(seats_per_table + 1, num_tables, num_decks=num_decks,
+                                wallet=BANKROLL, seed=seed)
+        self.tables.active[:, COUNTER_SEAT] = False
+
+        self.counters = [Counter(f"Counter {i+1}", entry, exit, unit, max_units)
+                         for i in range(num_counters)]
+        self.watcher = [None] * num_tables
+        self.watched = np.zeros(num_tables, dtype=bool)
+        for i, counter in enumerate(self.counters):
+            counter.table = i
+            self.watcher[i] = counter
+            self.watched[i] = True
+
+        self.clock = 0.0
+        self.next_round_end = self.round_seconds()
+
+    def round_seconds(self):
+        """How long each table's next round takes given who is sitting at it."""
+        seated = np.count_nonzero(self.tables.active, axis=1)
+        return SECONDS_PER_ROUND + SECONDS_PER_SEAT * seated
+
+    def hop(self, counter, true_counts):
+        """Moves a counter to the unwatched table with the highest true count."""
+        candidates = np.where(self.watched, -np.inf, true_counts)
+        best = int(candidates.argmax())
+        if candidates[best] == -np.inf:
+            return # Every other table is already watched
+        self.watcher[counter.table] = None
+        self.watched[counter.table] = False
+        counter.table = best
+        counter.hops += 1
+        self.watcher[best] = counter
+        self.watched[best] = True
+
+    def after_round(self, counter, true_counts):
+        """Lets a counter sit, size their bet, leave or hop."""
+        seats = self.tables.active
+        if true_counts[counter.table] < counter.exit:
+            if counter.seated:
+                counter.seated = False
+                seats[counter.table, COUNTER_SEAT] = False
+            self.hop(counter, true_counts)
+        true_count = true_counts[counter.table]
+        if not counter.seated and true_count >= counter.entry:
+            counter.seated = True
+            seats[counter.table, COUNTER_SEAT] = True
+        if counter.seated:
+            self.tables.stakes[counter.table, COUNTER_SEAT] = counter.bet_for(true_count)
+
+    def run(self, hours):
+        """Runs every table for the given number of simulated hours."""
+        end = self.clock + hours * 3600
+        tables = self.tables
+        wallets = tables.wallets[:, COUNTER_SEAT]
+
+        while True:
+            self.clock = self.next_round_end.min()
+            if self.clock > end:
+                break
+            due = self.next_round_end <= self.clock + TICK
+
+            before = wallets.copy()
+            tables.play_round(due)
+            true_counts = tables.get_true_count()
+            # Tables past the cut card shuffle before their next deal, so counters see a fresh shoe
+            true_counts[tables.cards_remaining < tables.shoe_size * tables.shuffle_penetration] = 0
+            for i in np.flatnonzero(due):
+                counter = self.watcher[i]
+                if counter is None:
+                    continue
+                if tables.status[i, COUNTER_SEAT] != OUT:
+                    counter.hands += 1
+                    counter.net += float(wallets[i] - before[i])
+                self.after_round(counter, true_counts)
+
+            np.add(self.next_round_end, self.round_seconds(), out=self.next_round_end, where=due)
+        self.clock = end
+
+    def report(self):
+        """Returns team totals: hands, net, win per hour and win per 100 hands."""
+        hours = self.clock / 3600
+        hands = sum(c.hands for c in self.counters)
+        net = sum(c.net for c in self.counters)
+        return {
+            'hours': hours,
+            'hands': hands,
+            'net': net,
+            'hops': sum(c.hops for c in self.counters),
+            'win_per_hour': net / hours / len(self.counters) if hours else 0,
+            'hands_per_hour': hands / hours / len(self.counters) if hours else 0,
+            'win_per_100_hands': 100 * net / hands if hands else 0,
+        }
+
+
+# --- Main ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare back-counting and table hopping with playing every hand.")
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--counters", type=int, default=100)
+    parser.add_argument("--seats", type=int, default=5, help="other players at each table")
+    parser.add_argument("--hours", type=float, default=100)
+    parser.add_argument("--entry", type=float, default=2)
+    parser.add_argument("--exit", type=float, default=0)
+    parser.add_argument("--max-units", type=int, default=8, help="largest wonging bet in units")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    # The baseline plays every hand at a flat one-unit bet
+    strategies = [
+        ("Wonging", args.entry, args.exit, args.max_units),
+        ("Play all", -float("inf"), -float("inf"), 1),
+    ]
+    print(f"{args.tables} tables, {args.counters} counters, {args.hours:g} hours each")
+    print(f"{'Strategy':<10} {'Hands/hr':>9} {'Win/hr':>9} {'Win/100':>9} {'Hops':>8} {'Time':>7}")
+    for name, entry, exit_count, max_units in strategies:
+        start = time.perf_counter()
+        scheduler = WongScheduler(args.tables, args.counters, args.seats, entry, exit_count,
+                                  max_units=max_units, seed=args.seed)
+        scheduler.run(args.hours)
+        r = scheduler.report()
+        print(f"{name:<10} {r['hands_per_hour']:>9.1f} {r['win_per_hour']:>9.2f} "
+              f"{r['win_per_100_hands']:>9.2f} {r['hops']:>8} {time.perf_counter() - start:>6.1f}s")